@@ -48,7 +48,95 @@ REQUIREMENTS:
 - File should contain properly formatted command exports from main.py
 """
 
-import re
+import functools
+import mmap
+import os
+import sys
+
+HEADER_FILE = 'midea_commands.h'
+
+# Every exported command starts with this marker line (see export_for_esp_idf)
+_CMD_MARKER = b'// Generated Midea AC IR Command: '
+
+# Lines of the "Command Analysis" comment written by export_for_esp_idf, in
+# the order they appear; each prefix is followed by the decoded value
+_ANALYSIS_START = b' * Command Analysis:'
+_FIELD_PREFIXES = (b' * Power: ', b' * Mode: ', b' * Temperature: ', b' * Fan Speed: ', b' * Swing: ')
+_ANALYSIS_END = b' */'
+
+def _decode_field(raw):
+    """Decode a captured header field (UTF-8, else latin-1, which maps every byte and never fails)"""
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+def _scan_block(buf, start, end):
+    """
+    Pull the name and analysis fields out of one command block.
+    
+    buf[start:end] is a single block, starting right after the marker. The
+    fields are located with buf.find() on the fixed line prefixes, so the
+    timing and byte arrays in between are skipped inside the C search
+    rather than visited line by line. Returns None for blocks without a
+    complete analysis comment (short commands).
+    """
+    nl = buf.find(b'\n', start, end)
+    if nl == -1:
+        return None
+    values = [buf[start:nl].rstrip(b'\r')]
+    
+    pos = buf.find(_ANALYSIS_START, nl, end)
+    if pos == -1:
+        return None
+    nl = buf.find(b'\n', pos, end)
+    if nl == -1:
+        return None
+    pos = nl + 1
+    
+    # The five fields must follow on consecutive lines, in order
+    for prefix in _FIELD_PREFIXES:
+        if buf.find(prefix, pos, pos + len(prefix)) != pos:
+            return None
+        nl = buf.find(b'\n', pos, end)
+        if nl == -1:
+            return None
+        values.append(buf[pos + len(prefix):nl].rstrip(b'\r'))
+        pos = nl + 1
+    
+    if buf.find(_ANALYSIS_END, pos, pos + len(_ANALYSIS_END)) != pos:
+        return None
+    return tuple(_decode_field(v) for v in values)
+
+@functools.lru_cache(maxsize=4)
+def _parse_commands(path, mtime_ns, size):
+    """
+    Extract (name, power, mode, temp, fan, swing) for every exported command.
+    
+    The header is memory-mapped and split into blocks by searching for the
+    marker line with mmap.find(); each block is handed to _scan_block(), so
+    the file is never read or decoded as a whole and no regex is involved.
+    mtime_ns and size are not used in the body; they are part of the
+    lru_cache key so a rewritten header is parsed again.
+    """
+    commands = []
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file - nothing has been exported yet
+            return ()
+        try:
+            pos = mm.find(_CMD_MARKER)
+            while pos != -1:
+                start = pos + len(_CMD_MARKER)
+                pos = mm.find(_CMD_MARKER, start)
+                command = _scan_block(mm, start, pos if pos != -1 else len(mm))
+                if command:
+                    commands.append(command)
+        finally:
+            mm.close()
+    return tuple(commands)
 
 def generate_command_summary():
     """
@@ -73,46 +161,52 @@ def generate_command_summary():
         - ESP-IDF code usage examples
         - List of available command identifiers
     """
+    # Parsing is cached on the header's mtime/size, so repeated calls only
+    # pay for an os.stat() until the file is regenerated
     try:
-        with open('midea_commands.h', 'r') as f:
-            content = f.read()
+        st = os.stat(HEADER_FILE)
+        commands = _parse_commands(os.path.abspath(HEADER_FILE), st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         print("Error: midea_commands.h not found. Run regenerate_commands.py first.")
         return
 
-    # Extract all command names and their analysis using regex pattern matching
-    commands = []
-    pattern = r'// Generated Midea AC IR Command: (.+?)\n.*?/\*\n \* Command Analysis:\n \* Power: (.+?)\n \* Mode: (.+?)\n \* Temperature: (.+?)\n \* Fan Speed: (.+?)\n \* Swing: (.+?)\n \*/'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
-        cmd_name, power, mode, temp, fan, swing = match.groups()
-        commands.append((cmd_name, power, mode, temp, fan, swing))
-
-    print('Generated Midea IR Commands Summary')
-    print('=' * 50)
-    print(f'Generated from CSV files in ir_captures/ folder')
-    print(f'Total commands: {len(commands)}')
-    print()
+    # Build the whole report in memory and emit it with a single write
+    out = [
+        'Generated Midea IR Commands Summary\n',
+        '=' * 50 + '\n',
+        'Generated from CSV files in ir_captures/ folder\n',
+        f'Total commands: {len(commands)}\n',
+        '\n',
+    ]
     
-    # Display detailed information for each command
+    # Display detailed information for each command, collecting the
+    # "available commands" list in the same pass
+    available = []
     for i, (name, power, mode, temp, fan, swing) in enumerate(commands, 1):
-        print(f'{i:2d}. {name.upper()}_TIMING[] & {name.upper()}_BYTES[]')
-        print(f'    File: {name}.csv')
-        print(f'    Power: {power}, Mode: {mode}, Temperature: {temp}')
-        print(f'    Fan: {fan}, Swing: {swing}')
-        print()
-
-    print('Usage in ESP-IDF:')
-    print('-' * 30)
-    print('// Send a command using timing array:')
-    print('esp_err_t result = send_ir_command(power_on_timing, POWER_ON_TIMING_COUNT);')
-    print()
-    print('// Or send using byte array:')
-    print('esp_err_t result = send_midea_bytes(power_on_bytes, POWER_ON_BYTES_COUNT);')
-    print()
-    print('Available commands can be used by replacing "power_on" with any of:')
-    for name, _, _, _, _, _ in commands:
-        print(f'  - {name}')
+        upper_name = name.upper()
+        out.append(
+            f'{i:2d}. {upper_name}_TIMING[] & {upper_name}_BYTES[]\n'
+            f'    File: {name}.csv\n'
+            f'    Power: {power}, Mode: {mode}, Temperature: {temp}\n'
+            f'    Fan: {fan}, Swing: {swing}\n'
+            '\n'
+        )
+        available.append(f'  - {name}\n')
+
+    out.append(
+        'Usage in ESP-IDF:\n'
+        + '-' * 30 + '\n'
+        '// Send a command using timing array:\n'
+        'esp_err_t result = send_ir_command(power_on_timing, POWER_ON_TIMING_COUNT);\n'
+        '\n'
+        '// Or send using byte array:\n'
+        'esp_err_t result = send_midea_bytes(power_on_bytes, POWER_ON_BYTES_COUNT);\n'
+        '\n'
+        'Available commands can be used by replacing "power_on" with any of:\n'
+    )
+    out.extend(available)
+
+    sys.stdout.write(''.join(out))
 
 if __name__ == "__main__":
     generate_command_summary()
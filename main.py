@@ -30,6 +30,11 @@ Process multiple files interactively:
     python main.py
     # Follow prompts to select files
 
+Process captures without any prompts, using the suggested command names
+(e.g. from scripts or xargs -P):
+    python main.py ir_captures/power_on.csv ir_captures/cool_mode.csv
+    python main.py --all
+
 Programmatic usage:
     from main import process_ir_file, import_from_csv
     durations = import_from_csv('your_file.csv')
@@ -55,11 +60,15 @@ The timing data format should be alternating pulse/space durations:
 [leader_pulse, leader_space, data_pulse_1, data_space_1, ...]
 """
 
-import csv
+import array
 import re
-import datetime as import_datetime
+import functools
+import operator
 import os
-import glob
+import sys
+
+# csv, datetime, fnmatch and pathlib are imported inside the functions that use
+# them, so callers that only decode bytes don't pay for them at import time
 
 # ==============================================================================
 # MIDEA AC IR PROTOCOL CONFIGURATION
@@ -84,6 +93,12 @@ SHORT_SPACE_MAX = 700     # Maximum short space
 LONG_SPACE_MIN = 1550     # Minimum long pulse duration
 LONG_SPACE_MAX = 1650     # Maximum long pulse duration
 
+# Field value names used by the decoders below, indexed directly by the
+# 3-bit field value (None marks values with no known meaning)
+_MODE_NAMES = ("Auto", "Cool", "Dry", "Fan", "Heat", None, None, None)
+_FAN_SPEED_NAMES = ("Auto", "Low", "Medium", "High", None, None, None, "Silent")
+_SWING_NAMES = ("Off", "Vertical", "Horizontal", "Vertical + Horizontal")
+
 def validate_leader(pulse, space):
     """
     Validate the IR signal leader sequence.
@@ -144,6 +159,67 @@ def decode_bit(pulse, space):
     else:
         return '?'  # Invalid pulse duration
 
+# decode_bit() results for every pulse length up to just past the long range
+# (with a valid space); the last entry stands for any longer pulse. Spaces only
+# invalidate a bit once they exceed _SPACE_LIMIT, since SHORT_SPACE_MIN sits
+# below the 700us end-of-transmission allowance.
+_PULSE_BITS = ''.join(decode_bit(p, SHORT_SPACE_MIN) for p in range(LONG_SPACE_MAX + 2))
+_SPACE_LIMIT = max(SHORT_SPACE_MAX, 700)
+
+def decode_bits(durations):
+    """
+    Decode every data bit of a capture in one pass.
+    
+    The durations after the leader are consumed as (pulse, space) pairs and
+    each pair is decoded like decode_bit(), but inline: the pulse indexes the
+    precomputed _PULSE_BITS table instead of going through range checks and
+    a function call per bit. Pulses outside the table fall back to
+    decode_bit().
+    
+    Args:
+        durations (list): Pulse/space durations in microseconds, starting
+                          with the leader pulse and leader space
+        
+    Returns:
+        str: One '0', '1' or '?' character per data bit
+        
+    Example:
+        >>> decode_bits([4424, 4424, 560, 560, 1600, 560])
+        '01'
+    """
+    table = _PULSE_BITS
+    size = len(table)
+    space_limit = _SPACE_LIMIT
+    # Pulses the table can't index (negative, past its end, or not an int)
+    # go through decode_bit() itself so they are classified the same way
+    return ''.join('?' if space > space_limit
+                   else table[pulse] if type(pulse) is int and 0 <= pulse < size
+                   else decode_bit(pulse, space)
+                   for pulse, space in zip(durations[2::2], durations[3::2]))
+
+def bits_to_bytes(bits_str):
+    """
+    Pack a binary bit string into bytes (MSB first).
+    
+    Only complete 8-bit groups are converted; trailing bits are ignored.
+    The whole string is parsed with a single int(..., 2) call and split
+    with int.to_bytes, rather than parsing every 8-character slice.
+    
+    Args:
+        bits_str (str): String of '0'/'1' characters
+        
+    Returns:
+        bytes: Packed byte values
+        
+    Example:
+        >>> bits_to_bytes("1010000110000010")
+        b'\\xa1\\x82'
+    """
+    n_bytes = len(bits_str) // 8
+    if not n_bytes:
+        return b''
+    return int(bits_str[:n_bytes * 8], 2).to_bytes(n_bytes, 'big')
+
 def decode_midea_temperature(byte_val):
     """
     Decode temperature setting from Midea command byte.
@@ -165,15 +241,30 @@ def decode_midea_temperature(byte_val):
         >>> decode_midea_temperature(0x00)  # 0x00 + 17 = 17°C  
         17
     """
+    temperature = midea_temperature_celsius(byte_val)
+    if temperature is not None:
+        return temperature
+    else:
+        return f"Unknown ({byte_val & 0x0F})"
+
+def midea_temperature_celsius(byte_val):
+    """
+    Temperature from Byte 2 as an int, or None outside the valid range.
+    
+    Same decoding as decode_midea_temperature() but with a single return
+    type, so callers can test "is not None" instead of isinstance().
+    
+    Example:
+        >>> midea_temperature_celsius(0x05)
+        22
+        >>> midea_temperature_celsius(0x0F) is None  # 32°C is out of range
+        True
+    """
     # Based on analysis: temperature is in Byte 2, formula: (byte2 & 0x0F) + 17
-    temp_bits = byte_val & 0x0F
-    temperature = temp_bits + 17
+    temperature = (byte_val & 0x0F) + 17
     
     # Validate reasonable temperature range
-    if 16 <= temperature <= 30:
-        return temperature
-    else:
-        return f"Unknown ({temp_bits})"
+    return temperature if 16 <= temperature <= 30 else None
 
 def decode_midea_mode(byte_val):
     """
@@ -201,14 +292,7 @@ def decode_midea_mode(byte_val):
         'Cool'
     """
     mode_bits = (byte_val >> 5) & 0x07  # Extract bits 5-7
-    modes = {
-        0x00: "Auto",
-        0x01: "Cool", 
-        0x02: "Dry",
-        0x03: "Fan",
-        0x04: "Heat"
-    }
-    return modes.get(mode_bits, f"Unknown mode ({mode_bits})")
+    return _MODE_NAMES[mode_bits] or f"Unknown mode ({mode_bits})"
 
 def decode_midea_fan_speed(byte_val):
     """
@@ -236,14 +320,7 @@ def decode_midea_fan_speed(byte_val):
         'Silent'
     """
     fan_bits = byte_val & 0x07  # Extract lower 3 bits
-    speeds = {
-        0x00: "Auto",
-        0x01: "Low",
-        0x02: "Medium", 
-        0x03: "High",
-        0x07: "Silent"
-    }
-    return speeds.get(fan_bits, f"Unknown speed ({fan_bits})")
+    return _FAN_SPEED_NAMES[fan_bits] or f"Unknown speed ({fan_bits})"
 
 def decode_midea_swing(byte_val):
     """
@@ -267,16 +344,8 @@ def decode_midea_swing(byte_val):
         >>> decode_midea_swing(0x00)  # bits 4+5 = 0 = No swing
         'Off'
     """
-    swing_vertical = (byte_val >> 4) & 0x01
-    swing_horizontal = (byte_val >> 5) & 0x01
-    
-    swing_status = []
-    if swing_vertical:
-        swing_status.append("Vertical")
-    if swing_horizontal:
-        swing_status.append("Horizontal")
-    
-    return " + ".join(swing_status) if swing_status else "Off"
+    # Bit 4 (vertical) and bit 5 (horizontal) together index _SWING_NAMES
+    return _SWING_NAMES[(byte_val >> 4) & 0x03]
 
 def decode_midea_power(byte_val):
     """
@@ -299,7 +368,39 @@ def decode_midea_power(byte_val):
     power_bit = (byte_val >> 7) & 0x01  # Use bit 7 instead of bit 5
     return "On" if power_bit else "Off"
 
-def decode_midea_command(bits_str):
+def decode_midea_fields(bytes_data):
+    """
+    Decode every AC setting of a command in one call.
+    
+    Does the same bit-field extraction as the decode_midea_* functions
+    above, but inline and straight from the command bytes, so a full report
+    costs a few shifts and tuple lookups instead of five decoder calls.
+    
+    Args:
+        bytes_data (bytes): The command bytes (at least 4: Bytes 0-3)
+        
+    Returns:
+        dict: 'power', 'mode', 'temperature', 'fan_speed' and 'swing', with
+              the same values the individual decoders return
+        
+    Example:
+        >>> decode_midea_fields(bytes((0xA1, 0x82, 0x45, 0x01)))['temperature']
+        22
+    """
+    byte1, byte2, byte3 = bytes_data[1], bytes_data[2], bytes_data[3]
+    mode_bits = (byte1 >> 5) & 0x07
+    temp_bits = byte2 & 0x0F
+    fan_bits = byte3 & 0x07
+    temperature = temp_bits + 17
+    return {
+        'power': "On" if byte1 & 0x80 else "Off",
+        'mode': _MODE_NAMES[mode_bits] or f"Unknown mode ({mode_bits})",
+        'temperature': temperature if 16 <= temperature <= 30 else f"Unknown ({temp_bits})",
+        'fan_speed': _FAN_SPEED_NAMES[fan_bits] or f"Unknown speed ({fan_bits})",
+        'swing': _SWING_NAMES[(byte3 >> 4) & 0x03],
+    }
+
+def decode_midea_command(bits_str, verbose=True):
     """
     Decode a complete Midea AC command from binary bit string.
     
@@ -310,6 +411,8 @@ def decode_midea_command(bits_str):
     Args:
         bits_str (str): Binary string representing the decoded IR signal
                        (e.g., "101010011001..." - typically 48+ bits)
+        verbose (bool): Print the analysis (default). With False nothing is
+                       formatted or printed; only the bytes are returned
     
     Process:
         1. Converts binary string to byte array
@@ -317,6 +420,10 @@ def decode_midea_command(bits_str):
         3. Calculates and validates checksum
         4. Displays detailed breakdown of all settings
         
+    Returns:
+        bytes: The complete bytes of bits_str (the same value bits_to_bytes
+               gives), so callers can reuse it instead of parsing again
+        
     Expected Command Structure (6+ bytes):
         Byte 0: Command identifier (usually 0xA1)
         Byte 1: Power state (bit 7) + Mode (bits 5-7)
@@ -335,47 +442,54 @@ def decode_midea_command(bits_str):
         Byte 2 (Temperature): 0x42 - Temperature: 22°C
         ...
     """
+    if not verbose:
+        # Nothing to display: skip the padding and all report formatting
+        return bits_to_bytes(bits_str)
+    
     if len(bits_str) < 48:
         print(f"Warning: Expected 48 bits, got {len(bits_str)} bits")
-        # Pad with zeros if too short
-        bits_str = bits_str.ljust(48, '0')
-    
-    # Convert binary string to bytes
-    bytes_data = []
-    for i in range(0, len(bits_str), 8):
-        byte_str = bits_str[i:i+8]
-        if len(byte_str) == 8:
-            byte_val = int(byte_str, 2)
-            bytes_data.append(byte_val)
+        # Pad with zeros if too short: shift the parsed value left instead of
+        # building a zero-padded copy of the string
+        bytes_data = (int(bits_str or '0', 2) << (48 - len(bits_str))).to_bytes(6, 'big')
+    else:
+        # Convert binary string to bytes
+        bytes_data = bits_to_bytes(bits_str)
     
-    print(f"Raw bytes: {' '.join(f'{b:02X}' for b in bytes_data)}")
+    # Collect the report and write it in one go rather than print per line
+    out = [f"Raw bytes: {bytes_data.hex(' ').upper()}\n"]
     
     if len(bytes_data) >= 6:
         # Enhanced Midea AC command structure analysis (corrected mapping)
-        print(f"\n--- Detailed Command Analysis ---")
-        print(f"Byte 0 (Command): 0x{bytes_data[0]:02X}")
-        print(f"Byte 1 (Power/Mode): 0x{bytes_data[1]:02X} - Power: {decode_midea_power(bytes_data[1])}, Mode: {decode_midea_mode(bytes_data[1])}")
-        print(f"Byte 2 (Temperature): 0x{bytes_data[2]:02X} - Temperature: {decode_midea_temperature(bytes_data[2])}°C")
-        print(f"Byte 3 (Fan/Swing): 0x{bytes_data[3]:02X} - Fan: {decode_midea_fan_speed(bytes_data[3])}, Swing: {decode_midea_swing(bytes_data[3])}")
-        print(f"Byte 4 (Extra): 0x{bytes_data[4]:02X}")
-        print(f"Byte 5 (Checksum): 0x{bytes_data[5]:02X}")
+        # Unpack the six command bytes to plain ints once
+        byte0, byte1, byte2, byte3, byte4, byte5 = bytes_data[:6]
+        fields = decode_midea_fields(bytes_data)
+        out.append(f"\n--- Detailed Command Analysis ---\n"
+                   f"Byte 0 (Command): 0x{byte0:02X}\n"
+                   f"Byte 1 (Power/Mode): 0x{byte1:02X} - Power: {fields['power']}, Mode: {fields['mode']}\n"
+                   f"Byte 2 (Temperature): 0x{byte2:02X} - Temperature: {fields['temperature']}°C\n"
+                   f"Byte 3 (Fan/Swing): 0x{byte3:02X} - Fan: {fields['fan_speed']}, Swing: {fields['swing']}\n"
+                   f"Byte 4 (Extra): 0x{byte4:02X}\n"
+                   f"Byte 5 (Checksum): 0x{byte5:02X}\n")
         
         # Calculate checksum (XOR of all bytes except last)
-        calculated_checksum = 0
-        for i in range(len(bytes_data) - 1):
-            calculated_checksum ^= bytes_data[i]
+        calculated_checksum = functools.reduce(operator.xor, bytes_data[:-1], 0)
         
         if len(bytes_data) > 5:
             checksum_valid = calculated_checksum == bytes_data[-1]
-            print(f"Checksum: {'✓ Valid' if checksum_valid else '✗ Invalid'} (calculated: 0x{calculated_checksum:02X})")
+            out.append(f"Checksum: {'✓ Valid' if checksum_valid else '✗ Invalid'} (calculated: 0x{calculated_checksum:02X})\n")
             
         # Show bit-level analysis for debugging
-        print(f"\n--- Bit Analysis ---")
+        out.append("\n--- Bit Analysis ---\n")
         for i, byte_val in enumerate(bytes_data[:6]):
-            print(f"Byte {i}: 0x{byte_val:02X} = {byte_val:08b}")
+            out.append(f"Byte {i}: 0x{byte_val:02X} = {byte_val:08b}\n")
             
     if len(bytes_data) < 6:
-        print("Warning: Incomplete command - need at least 6 bytes for proper Midea decoding")
+        out.append("Warning: Incomplete command - need at least 6 bytes for proper Midea decoding\n")
+    
+    sys.stdout.write("".join(out))
+    
+    # Zero padding above only affects the display; return complete bytes only
+    return bytes_data[:len(bits_str) // 8]
 
 def import_from_csv(filename):
     """
@@ -393,8 +507,10 @@ def import_from_csv(filename):
         filename (str): Path to the CSV file containing IR capture data
         
     Returns:
-        list or None: List of pulse/space durations in microseconds,
-                     or None if file cannot be read or format not recognized
+        array.array or None: Pulse/space durations in microseconds (a
+                     compact array of 64-bit ints that indexes and slices
+                     like a list), or None if file cannot be read or format
+                     not recognized
                      
     CSV Format Requirements:
         - Must have a time column (seconds, milliseconds, or microseconds)
@@ -409,15 +525,17 @@ def import_from_csv(filename):
     durations = []
     
     try:
-        with open(filename, 'r') as file:
-            # Try to detect CSV format automatically
-            sample = file.read(1024)
+        # A large buffer lets csv pull big captures in with a few reads
+        # instead of one per 8 KiB block
+        with open(filename, 'r', buffering=1 << 20) as file:
+            # Try to detect CSV format automatically from the header line
+            header = file.readline()
             file.seek(0)
             
             # Check for common logic analyzer CSV formats
-            if 'Time [s]' in sample or 'Time(s)' in sample:
+            if 'Time [s]' in header or 'Time(s)' in header:
                 durations = parse_saleae_csv(file)
-            elif 'Time' in sample and 'Channel' in sample:
+            elif 'Time' in header and 'Channel' in header:
                 durations = parse_generic_csv(file)
             else:
                 print("Unknown CSV format. Please check the file format.")
@@ -434,110 +552,118 @@ def import_from_csv(filename):
 
 def parse_saleae_csv(file):
     """Parse Saleae Logic CSV export format"""
-    durations = []
-    reader = csv.DictReader(file)
+    import csv
+    
+    durations = array.array('q')  # Raw machine ints, no per-value objects
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return durations
+    
+    # Resolve the time and digital state columns once from the header
+    if 'Time [s]' in header:
+        time_idx = header.index('Time [s]')
+    elif 'Time(s)' in header:
+        time_idx = header.index('Time(s)')
+    else:
+        return durations  # Without a time column there are no durations
     
-    prev_time = None
-    prev_state = None
+    state_idx = None
+    for idx, key in enumerate(header):
+        if 'Channel' in key or 'Digital' in key or key.strip().startswith('Channel'):
+            state_idx = idx
+            break
+    if state_idx is None:
+        # If no channel found, try to get the second column
+        if len(header) > 1:
+            state_idx = 1
+        else:
+            return durations
+    
+    # Only collect timestamps in the row loop; durations are derived from
+    # them afterwards in one pass
+    times = []
+    add_time = times.append
     
     for row in reader:
         try:
             # Get time in seconds and convert to microseconds
-            time_s = float(row.get('Time [s]', row.get('Time(s)', 0)))
-            time_us = time_s * 1_000_000
-            
-            # Get digital state - look for any channel column
-            state_key = None
-            for key in row.keys():
-                if 'Channel' in key or 'Digital' in key or key.strip().startswith('Channel'):
-                    state_key = key
-                    break
+            time_us = float(row[time_idx]) * 1_000_000
             
-            if state_key:
-                state = int(row[state_key])
-            else:
-                # If no channel found, try to get the second column
-                keys = list(row.keys())
-                if len(keys) > 1:
-                    state = int(row[keys[1]])
-                else:
-                    continue
-                
-            if prev_time is not None and prev_state is not None:
-                duration = int(time_us - prev_time)
-                if duration > 0:  # Filter out zero-duration events
-                    durations.append(duration)
-            
-            prev_time = time_us
-            prev_state = state
-            
-        except (ValueError, KeyError) as e:
+            # Rows without a valid digital state are skipped
+            int(row[state_idx])
+        except (ValueError, IndexError):
             continue
+        add_time(time_us)
     
+    durations.extend(_durations_from_times(times))
     return durations
 
 def parse_generic_csv(file):
     """Parse generic logic analyzer CSV format"""
-    durations = []
-    reader = csv.DictReader(file)
+    import csv
+    
+    durations = array.array('q')  # Raw machine ints, no per-value objects
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return durations
+    
+    # Try different time column names, resolved once from the header
+    time_idx = None
+    for time_key in ['Time', 'Time [s]', 'Time(s)', 'Timestamp']:
+        if time_key in header:
+            time_idx = header.index(time_key)
+            break
     
-    prev_time = None
+    if time_idx is None:
+        return durations
+    
+    # Only collect timestamps in the row loop; durations are derived from
+    # them afterwards in one pass
+    times = []
+    add_time = times.append
     
     for row in reader:
         try:
-            # Try different time column names
-            time_val = None
-            for time_key in ['Time', 'Time [s]', 'Time(s)', 'Timestamp']:
-                if time_key in row:
-                    time_val = float(row[time_key])
-                    break
-            
-            if time_val is None:
-                continue
-                
-            # Convert to microseconds if needed
-            if time_val < 1:  # Assume seconds
-                time_us = time_val * 1_000_000
-            elif time_val < 1000:  # Assume milliseconds
-                time_us = time_val * 1000
-            else:  # Assume already microseconds
-                time_us = time_val
-            
-            if prev_time is not None:
-                duration = int(time_us - prev_time)
-                if duration > 0:
-                    durations.append(duration)
-            
-            prev_time = time_us
-            
-        except (ValueError, KeyError):
+            time_val = float(row[time_idx])
+        except (ValueError, IndexError):
             continue
-    
+        
+        # Convert to microseconds if needed
+        if time_val < 1:  # Assume seconds
+            add_time(time_val * 1_000_000)
+        elif time_val < 1000:  # Assume milliseconds
+            add_time(time_val * 1000)
+        else:  # Assume already microseconds
+            add_time(time_val)
+    
+    durations.extend(_durations_from_times(times))
     return durations
 
+def _durations_from_times(times):
+    """Yield the positive whole-microsecond gaps between consecutive timestamps"""
+    prev_time = None
+    for time_us in times:
+        if prev_time is not None:
+            try:
+                duration = int(time_us - prev_time)
+            except ValueError:  # NaN gap: skip this timestamp like a bad row
+                continue
+            if duration > 0:  # Filter out zero-duration events
+                yield duration
+        prev_time = time_us
+
+# First number on each line, skipping lines whose first non-blank character
+# is '#'; applied to the whole file at once instead of line by line
+_NUM_RE = re.compile(rb'^(?![^\S\n]*#)[^\d.\n]*([\d.]+)', re.MULTILINE)
+
 def import_from_text(filename):
-    """Import timing data from simple text file (one duration per line)"""
-    durations = []
+    """Import timing data from simple text file (one duration per line) as an array.array of ints"""
+    import pathlib
     
     try:
-        with open(filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if line and not line.startswith('#'):  # Skip empty lines and comments
-                    try:
-                        # Extract number from line (handles various formats)
-                        numbers = re.findall(r'[\d.]+', line)
-                        if numbers:
-                            duration = float(numbers[0])
-                            # Convert to microseconds if needed
-                            if duration < 1:  # Assume seconds
-                                duration *= 1_000_000
-                            elif duration < 1000:  # Assume milliseconds
-                                duration *= 1000
-                            durations.append(int(duration))
-                    except ValueError:
-                        continue
-                        
+        data = pathlib.Path(filename).read_bytes()
     except FileNotFoundError:
         print(f"File {filename} not found")
         return None
@@ -545,101 +671,122 @@ def import_from_text(filename):
         print(f"Error reading text file: {e}")
         return None
     
-    return durations
+    if b'\r' in data:
+        # Universal newlines, as text-mode reading would give: '\r\n' and a
+        # lone '\r' both end a line
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    numbers = None
+    if not data.translate(None, b'0123456789.\n'):
+        # Plain layout, nothing but one number per line: split and convert
+        # in C without the regex
+        try:
+            numbers = list(map(float, data.split()))
+        except ValueError:
+            pass  # A malformed number such as "1.2.3": use the regex path
+    if numbers is None:
+        numbers = []
+        for number in _NUM_RE.findall(data):
+            try:
+                numbers.append(float(number))
+            except ValueError:
+                continue
+    
+    # Convert to microseconds if needed: values below 1 are taken as seconds,
+    # below 1000 as milliseconds, anything else as microseconds already.
+    # Stored as raw machine ints, the same as the CSV importers return
+    try:
+        return array.array('q', [int(duration * 1_000_000) if duration < 1
+                                 else int(duration * 1000) if duration < 1000
+                                 else int(duration)
+                                 for duration in numbers])
+    except OverflowError as e:  # A value beyond 64 bits (or infinite)
+        print(f"Error reading text file: {e}")
+        return None
 
 def find_ir_signal_start(durations, min_pulse_length=4000):
     """Find the start of the actual IR signal, skipping long idle periods"""
-    for i in range(0, len(durations) - 1, 2):
-        if i + 1 < len(durations):
-            pulse = durations[i]
-            space = durations[i + 1]
-            # Look for the first reasonable pulse (not the long idle period)
-            if pulse >= min_pulse_length and space >= min_pulse_length:
-                return i
+    # Walk the (pulse, space) pairs by mapping min() over the even/odd slices:
+    # both halves clear the threshold exactly when the smaller one does, so
+    # the per-pair test is a single comparison done on C-produced values
+    for pair_idx, shorter in enumerate(map(min, durations[0::2], durations[1::2])):
+        # Look for the first reasonable pulse (not the long idle period)
+        if shorter >= min_pulse_length:
+            return pair_idx * 2
     return 0
 
 def clean_bits_string(bits_str):
     """Clean up the bits string by removing invalid bits and finding the main signal"""
-    # Remove leading and trailing invalid bits
-    start = 0
-    end = len(bits_str)
-    
-    # Find first valid bit
-    for i, bit in enumerate(bits_str):
-        if bit in '01':
-            start = i
-            break
-    
-    # Find last valid bit
-    for i in range(len(bits_str) - 1, -1, -1):
-        if bits_str[i] in '01':
-            end = i + 1
-            break
-    
-    cleaned = bits_str[start:end]
-    
-    # Replace any remaining '?' with '0' (conservative approach)
-    cleaned = cleaned.replace('?', '0')
-    
-    return cleaned
-
-def export_for_esp_idf(bits_string, bytes_data, command_name, durations, filename="midea_commands.h"):
-    """Export decoded command for ESP-IDF C code"""
-    
-    # Generate timing data array
-    timing_data = []
-    for i in range(2, len(durations) - 1, 2):
-        if i + 1 < len(durations):
-            pulse = durations[i]
-            space = durations[i + 1]
-            timing_data.extend([pulse, space])
-    
-    # Create C header content
-    header_content = f"""
+    # decode_bit only yields '0', '1' or '?', so trimming leading and trailing
+    # invalid bits is a plain strip('?'); remaining '?' become '0'
+    # (conservative approach). A string with no valid bits at all is kept
+    # whole, as before.
+    return bits_str.strip('?').replace('?', '0') or bits_str.replace('?', '0')
+
+def export_for_esp_idf(bits_string, bytes_data, command_name, durations, filename="midea_commands.h", header_file=None):
+    """Export decoded command for ESP-IDF C code (into header_file if given, an already open handle on filename)"""
+    import datetime as import_datetime
+    
+    # Generate timing data array: the pulse/space pairs after the leader are
+    # already interleaved, so take them as one slice (dropping an unpaired
+    # trailing pulse)
+    timing_data = durations[2:2 + (len(durations) - 2) // 2 * 2]
+    
+    # Timestamp and identifier spellings are computed once up front
+    timestamp = import_datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    upper_name = command_name.upper()
+    lower_name = command_name.lower()
+    
+    # Create C header content; pieces are collected in a list and joined once
+    out = [f"""
 // Generated Midea AC IR Command: {command_name}
 // Created by: Midea IR Decoder (https://github.com/deadtechsolutions/IR-decoder)
 // Author: Orpheus Johansson (deadtechsolutions)
-// Decoded on {import_datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+// Decoded on {timestamp}
 // Raw bytes: {' '.join(f'0x{b:02X}' for b in bytes_data)}
 
-#define {command_name.upper()}_TIMING_COUNT {len(timing_data)}
-static const uint32_t {command_name.lower()}_timing[] = {{
-"""
+#define {upper_name}_TIMING_COUNT {len(timing_data)}
+static const uint32_t {lower_name}_timing[] = {{
+"""]
     
-    # Add timing data in groups of 8 for readability
-    for i in range(0, len(timing_data), 8):
-        line_data = timing_data[i:i+8]
-        line = "    " + ", ".join(f"{t:4d}" for t in line_data)
-        if i + 8 < len(timing_data):
-            line += ","
-        header_content += line + "\n"
+    # Add timing data in groups of 8 for readability; every value is
+    # formatted once through map() and the rows are joined in one go
+    cells = list(map("{:4d}".format, timing_data))
+    if cells:
+        out.append("    " + ",\n    ".join(", ".join(cells[i:i+8]) for i in range(0, len(cells), 8)) + "\n")
     
-    header_content += "};\n\n"
+    out.append("};\n\n")
     
     # Add raw bytes array
-    header_content += f"#define {command_name.upper()}_BYTES_COUNT {len(bytes_data)}\n"
-    header_content += f"static const uint8_t {command_name.lower()}_bytes[] = {{\n"
-    header_content += "    " + ", ".join(f"0x{b:02X}" for b in bytes_data) + "\n"
-    header_content += "};\n\n"
+    out.append(f"#define {upper_name}_BYTES_COUNT {len(bytes_data)}\n"
+               f"static const uint8_t {lower_name}_bytes[] = {{\n"
+               "    " + ", ".join(map("0x{:02X}".format, bytes_data)) + "\n"
+               "};\n\n")
     
     # Add command info as comments
     if len(bytes_data) >= 6:
-        header_content += f"/*\n"
-        header_content += f" * Command Analysis:\n"
-        header_content += f" * Power: {decode_midea_power(bytes_data[1])}\n"
-        header_content += f" * Mode: {decode_midea_mode(bytes_data[1])}\n" 
-        header_content += f" * Temperature: {decode_midea_temperature(bytes_data[2])}°C\n"
-        header_content += f" * Fan Speed: {decode_midea_fan_speed(bytes_data[3])}\n"
-        header_content += f" * Swing: {decode_midea_swing(bytes_data[3])}\n"
-        header_content += f" */\n\n"
+        fields = decode_midea_fields(bytes_data)
+        out.append(f"/*\n"
+                   f" * Command Analysis:\n"
+                   f" * Power: {fields['power']}\n"
+                   f" * Mode: {fields['mode']}\n"
+                   f" * Temperature: {fields['temperature']}°C\n"
+                   f" * Fan Speed: {fields['fan_speed']}\n"
+                   f" * Swing: {fields['swing']}\n"
+                   f" */\n\n")
+    
+    header_content = "".join(out)
     
     # Write to file
     try:
-        with open(filename, 'a') as f:
-            f.write(header_content)
-        print(f"\n✓ Exported command '{command_name}' to {filename}")
-        print(f"  - Timing array: {command_name.lower()}_timing[{len(timing_data)}]")
-        print(f"  - Bytes array: {command_name.lower()}_bytes[{len(bytes_data)}]")
+        if header_file is None:
+            with open(filename, 'a') as f:
+                f.write(header_content)
+        else:
+            header_file.write(header_content)
+        sys.stdout.write(f"\n✓ Exported command '{command_name}' to {filename}\n"
+                         f"  - Timing array: {lower_name}_timing[{len(timing_data)}]\n"
+                         f"  - Bytes array: {lower_name}_bytes[{len(bytes_data)}]\n")
     except Exception as e:
         print(f"Error writing to {filename}: {e}")
 
@@ -809,9 +956,94 @@ esp_err_t send_midea_bytes(const uint8_t* bytes, size_t count) {
     with open("midea_ir_blaster.c", 'w') as f:
         f.write(impl)
 
-def process_multiple_files():
-    """Process multiple CSV files in the ir_captures folder"""
-    csv_files = glob.glob("ir_captures/*.csv")
+# Set once the template files are known to exist, so a batch of exports
+# checks the disk for them only the first time
+_template_ready = False
+
+def ensure_esp_idf_template():
+    """Create the ESP-IDF template files if they don't exist yet.
+
+    Returns True if this call created them.
+    """
+    global _template_ready
+    if _template_ready:
+        return False
+    created = not os.path.exists("midea_ir_blaster.h")
+    if created:
+        create_esp_idf_template()
+    # Only remembered once the files are there; a failed write raises
+    # above and is retried on the next export
+    _template_ready = True
+    return created
+
+# Below this many bytes of CSV in total, starting worker processes costs more
+# than parsing the captures serially
+_PARALLEL_LOAD_BYTES = 4 * 1024 * 1024
+
+def _load_capture(path):
+    """Process-pool worker: import_from_csv plus whatever it printed"""
+    import contextlib
+    import io
+    
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        durations = import_from_csv(path)
+    return durations, messages.getvalue()
+
+def capture_loader(paths):
+    """
+    Return a function that loads each of paths like import_from_csv.
+    
+    When the captures are large enough, all of them are parsed up front in a
+    process pool (one file per core); the returned function then hands back
+    each file's durations and replays its messages, so output order is the
+    same as loading the files one by one. Small batches just get
+    import_from_csv itself.
+    """
+    paths = list(dict.fromkeys(paths))  # Each file is parsed once
+    try:
+        total_bytes = sum(os.path.getsize(p) for p in paths)
+    except OSError:
+        # A missing or unreadable file: load serially so import_from_csv
+        # reports it and the rest still get processed
+        return import_from_csv
+    if len(paths) < 2 or total_bytes < _PARALLEL_LOAD_BYTES:
+        return import_from_csv
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    executor = ProcessPoolExecutor()
+    pending = {path: executor.submit(_load_capture, path) for path in paths}
+    executor.shutdown(wait=False)  # Queued loads still run to completion
+    
+    def load(path):
+        durations, messages = pending[path].result()
+        sys.stdout.write(messages)
+        return durations
+    return load
+
+def find_capture_files(folder="ir_captures"):
+    """
+    List the CSV captures in folder, like glob.glob(folder + "/*.csv").
+    
+    A single os.scandir pass reads the names together with their file type,
+    so no per-entry stat calls are made; fnmatch keeps glob's platform case
+    rules, and hidden files are skipped as glob does.
+    """
+    import fnmatch
+    
+    try:
+        with os.scandir(folder) as entries:
+            return [entry.path for entry in entries
+                    if not entry.name.startswith('.')
+                    and fnmatch.fnmatch(entry.name, '*.csv')
+                    and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+def process_multiple_files(ask=True):
+    """Process multiple CSV files in the ir_captures folder (all of them without asking if ask is False)"""
+    csv_files = find_capture_files()
     if not csv_files:
         print("No CSV files found in ir_captures folder")
         return
@@ -820,7 +1052,7 @@ def process_multiple_files():
     for i, file in enumerate(csv_files):
         print(f"  {i+1}. {os.path.basename(file)}")
     
-    choice = input("\nProcess all files? (y/n) or enter file number: ").strip().lower()
+    choice = input("\nProcess all files? (y/n) or enter file number: ").strip().lower() if ask else 'y'
     
     if choice == 'y':
         files_to_process = csv_files
@@ -830,22 +1062,27 @@ def process_multiple_files():
         print("Invalid choice")
         return
     
-    for file in files_to_process:
+    process_files(files_to_process, ask=ask)
+
+def process_files(files, ask=True):
+    """Load and process each CSV capture in files, in order (taking the suggested command names if ask is False)"""
+    load = capture_loader(files)
+    for file in files:
         print(f"\n{'='*50}")
         print(f"Processing: {os.path.basename(file)}")
         print('='*50)
         
         # Process the file (similar to main logic)
-        durations = import_from_csv(file)
+        durations = load(file)
         if durations is None:
             print(f"Failed to load {file}")
             continue
             
         # Process this file with the main logic
-        process_ir_file(durations, file)
+        process_ir_file(durations, file, ask=ask)
 
-def process_ir_file(durations, filename):
-    """Process a single IR file"""
+def process_ir_file(durations, filename, ask=True):
+    """Process a single IR file (using the suggested command name without asking if ask is False)"""
     print(f"Successfully loaded {len(durations)} timing values from {filename}")
 
     if len(durations) < 4:
@@ -869,16 +1106,8 @@ def process_ir_file(durations, filename):
         print(f"Valid Midea leader detected - Pulse: {leader_pulse}us, Space: {leader_space}us")
 
     # Decode data bits
-    bits = []
-    for i in range(2, len(durations) - 1, 2):
-        if i + 1 < len(durations):
-            pulse = durations[i]
-            space = durations[i + 1]
-            bit = decode_bit(pulse, space)
-            bits.append(bit)
-
-    bits_string = ''.join(bits)
-    print(f"\nDecoded bits ({len(bits)} total): {bits_string}")
+    bits_string = decode_bits(durations)
+    print(f"\nDecoded bits ({len(bits_string)} total): {bits_string}")
 
     # Clean up the bits for analysis
     if '?' in bits_string:
@@ -891,35 +1120,31 @@ def process_ir_file(durations, filename):
     # Decode Midea command
     if len(analysis_bits) >= 24:  # Need at least some bits for analysis
         print("\n--- Midea AC Command Analysis ---")
-        decode_midea_command(analysis_bits)
-        
-        # Convert bits to bytes for export
-        bytes_data = []
-        for i in range(0, len(analysis_bits), 8):
-            byte_str = analysis_bits[i:i+8]
-            if len(byte_str) == 8:
-                byte_val = int(byte_str, 2)
-                bytes_data.append(byte_val)
+        # The decoder hands back the parsed bytes for the export step
+        bytes_data = decode_midea_command(analysis_bits)
         
         # Generate suggested command name based on decoded data and filename
         suggested_name = generate_command_name(bytes_data, filename)
         print(f"\nSuggested command name: '{suggested_name}'")
         
-        # Ask user for command name with suggestion
-        user_input = input(f"Enter command name (press Enter for '{suggested_name}'): ").strip()
+        # Ask user for command name with suggestion (closed stdin counts as Enter)
+        user_input = ''
+        if ask:
+            try:
+                user_input = input(f"Enter command name (press Enter for '{suggested_name}'): ").strip()
+            except EOFError:
+                print()
         command_name = user_input if user_input else suggested_name
         
         if command_name:
             # Clean command name for C identifier
-            command_name = command_name.replace(' ', '_').replace('-', '_')
-            command_name = ''.join(c for c in command_name if c.isalnum() or c == '_')
+            command_name = clean_command_name(command_name)
             
             if command_name:
                 export_for_esp_idf(analysis_bits, bytes_data, command_name, durations)
                 
                 # Create template files on first export
-                if not os.path.exists("midea_ir_blaster.h"):
-                    create_esp_idf_template()
+                if ensure_esp_idf_template():
                     print("\n✓ Created ESP-IDF template files:")
                     print("  - midea_ir_blaster.h (header file)")
                     print("  - midea_ir_blaster.c (implementation)")
@@ -930,37 +1155,63 @@ def process_ir_file(durations, filename):
     else:
         print(f"\nWarning: Only {len(analysis_bits)} valid bits found. Need more data for proper decoding.")
 
+# Maps '-' and ' ' to '_' and deletes every other ASCII character that can't
+# appear in a C identifier, in a single str.translate pass
+_IDENTIFIER_TABLE = str.maketrans('- ', '__', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in '_- ')))
+
+def clean_command_name(name):
+    """Turn a command name into a C identifier ('-' and ' ' become '_', other symbols are dropped)"""
+    name = name.translate(_IDENTIFIER_TABLE)
+    if not name.isascii():
+        # Rare non-ASCII names: keep the original Unicode-aware filter
+        name = ''.join(c for c in name if c.isalnum() or c == '_')
+    return name
+
+# Any of these substrings marks a capture filename as already descriptive:
+# a temperature (16-30), a mode word or a power word. One alternation scans
+# the name once instead of testing each word separately.
+_DESCRIPTIVE_NAME_RE = re.compile(r'1[6-9]|2[0-9]|30|auto|cool|heat|dry|fan|power|on|off')
+
 def generate_command_name(bytes_data, filename):
     """Generate a suggested command name based on filename (primary) and decoded data (validation)"""
+    # Only the first 6 bytes affect the name; as immutable bytes they make a
+    # cache key, so re-processing the same capture skips the work below
+    return _generate_command_name(bytes(bytes_data[:6]), filename)
+
+@functools.lru_cache(maxsize=512)
+def _capture_stem(filename):
+    """Base filename without directory or extension, parsed once per path"""
+    return os.path.splitext(os.path.basename(filename))[0]
+
+@functools.lru_cache(maxsize=1024)
+def _generate_command_name(bytes_data, filename):
+    """Memoized body of generate_command_name (bytes_data must be bytes)"""
     # Extract base filename without path and extension
-    base_name = os.path.splitext(os.path.basename(filename))[0]
+    base_name = _capture_stem(filename)
     
-    # Use filename as the primary source for command naming
-    suggested = base_name.lower()
+    # Use filename as the primary source for command naming (lowercased once
+    # for both the identifier and the descriptive-word check below)
+    filename_lower = base_name.lower()
     
     # Clean up the name for C identifier
-    suggested = suggested.replace('-', '_').replace(' ', '_')
-    suggested = ''.join(c for c in suggested if c.isalnum() or c == '_')
+    suggested = clean_command_name(filename_lower)
     
     # Optional: Add validation comment showing if filename matches decoded data
     if len(bytes_data) >= 6:
-        power = decode_midea_power(bytes_data[1])
-        mode = decode_midea_mode(bytes_data[1])
-        temp = decode_midea_temperature(bytes_data[2])
-        
-        # Add decoded info as suffix only if filename doesn't contain enough info
-        filename_lower = base_name.lower()
-        has_temp = any(str(i) in filename_lower for i in range(16, 31))
-        has_mode = any(mode_word in filename_lower for mode_word in ['auto', 'cool', 'heat', 'dry', 'fan'])
-        has_power = any(power_word in filename_lower for power_word in ['power', 'on', 'off'])
-        
-        # If filename is too generic, add decoded info
-        if not (has_temp or has_mode or has_power):
-            suggested += f"_{power.lower()}"
+        # Add decoded info as suffix only if filename doesn't contain enough
+        # info (descriptive names return without decoding anything)
+        if not _DESCRIPTIVE_NAME_RE.search(filename_lower):
+            fields = decode_midea_fields(bytes_data)
+            mode = fields['mode']
+            temp = midea_temperature_celsius(bytes_data[2])
+            # Collect the suffix parts and join them once
+            parts = [suggested, fields['power'].lower()]
             if mode != "Auto" and mode != "Unknown mode (0)":
-                suggested += f"_{mode.lower()}"
-            if isinstance(temp, int) and 16 <= temp <= 30:
-                suggested += f"_{temp}c"
+                parts.append(mode.lower())
+            if temp is not None:
+                parts.append(f"{temp}c")
+            suggested = "_".join(parts)
     
     return suggested
 
@@ -1008,6 +1259,27 @@ TROUBLESHOOTING:
 - Adjust protocol timing parameters if needed for your specific AC model
 """
 if __name__ == "__main__":
+    # Block-buffer stdout even on a terminal so the per-line report prints
+    # don't each cost a write; input() flushes pending output before every
+    # prompt, so the interactive flow is unaffected
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Decode Midea AC IR captures and export them for ESP-IDF.")
+    parser.add_argument('files', nargs='*',
+                        help="CSV captures to process (default: ir_captures/digital.csv, then offer more)")
+    parser.add_argument('--all', action='store_true',
+                        help="process every CSV in ir_captures/ without the file menu")
+    args = parser.parse_args()
+    
+    if args.all:
+        process_multiple_files(ask=False)
+        sys.exit(0)
+    if args.files:
+        process_files(args.files, ask=False)
+        sys.exit(0)
+    
     # Load captured IR data from the ir_captures folder
     durations = import_from_csv('ir_captures/digital.csv')
     if durations is None:
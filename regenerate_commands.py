@@ -48,9 +48,40 @@ REQUIREMENTS:
 - CSV files should follow logic analyzer export format
 """
 
-from main import *
-import glob
+import contextlib
+import io
 import os
+import sys
+
+from main import (
+    capture_loader,
+    clean_bits_string,
+    clean_command_name,
+    decode_bits,
+    decode_midea_command,
+    ensure_esp_idf_template,
+    export_for_esp_idf,
+    find_capture_files,
+    find_ir_signal_start,
+    generate_command_name,
+    validate_leader,
+)
+
+class _LazyHeader:
+    """Append handle on a header file that is only opened by the first write"""
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = None
+    
+    def write(self, text):
+        if self.file is None:
+            self.file = open(self.filename, 'a', buffering=1 << 20)
+        return self.file.write(text)
+    
+    def close(self):
+        if self.file is not None:
+            self.file.close()
 
 def regenerate_all_commands():
     """
@@ -78,33 +109,46 @@ def regenerate_all_commands():
     
     Note: This will overwrite the existing midea_commands.h file.
     """
-    csv_files = glob.glob("ir_captures/*.csv")
+    csv_files = find_capture_files()
     if not csv_files:
         print("No CSV files found in ir_captures folder")
         return
     
+    names = [os.path.basename(file) for file in csv_files]
     print(f"Found {len(csv_files)} CSV files to process:")
-    for i, file in enumerate(csv_files):
-        print(f"  {i+1}. {os.path.basename(file)}")
+    for i, name in enumerate(names):
+        print(f"  {i+1}. {name}")
     
     print("\nProcessing all files with automatic naming...")
     
-    for file in csv_files:
-        print(f"\n{'='*50}")
-        print(f"Processing: {os.path.basename(file)}")
-        print('='*50)
-        
-        # Process the file
-        durations = import_from_csv(file)
-        if durations is None:
-            print(f"Failed to load {file}")
-            continue
-            
-        # Process this file with automatic naming
-        process_ir_file_auto(durations, file)
-
-def process_ir_file_auto(durations, filename):
-    """Process a single IR file with automatic naming"""
+    load = capture_loader(csv_files)
+    # Open the header once for the whole batch with a large buffer, so the
+    # exported commands reach the disk in a few big writes instead of one
+    # open/append/close per command; a batch that exports nothing never
+    # creates or touches the file
+    with contextlib.closing(_LazyHeader("midea_commands.h")) as header_file:
+        for file, name in zip(csv_files, names):
+            # Buffer each file's report and write it once, rather than one
+            # flushed terminal write per print()
+            report = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(report):
+                    print(f"\n{'='*50}")
+                    print(f"Processing: {name}")
+                    print('='*50)
+                    
+                    # Process the file
+                    durations = load(file)
+                    if durations is None:
+                        print(f"Failed to load {file}")
+                    else:
+                        # Process this file with automatic naming
+                        process_ir_file_auto(durations, file, header_file)
+            finally:
+                sys.stdout.write(report.getvalue())
+
+def process_ir_file_auto(durations, filename, header_file=None):
+    """Process a single IR file with automatic naming (exporting into header_file if given)"""
     print(f"Successfully loaded {len(durations)} timing values from {filename}")
 
     if len(durations) < 4:
@@ -128,16 +172,8 @@ def process_ir_file_auto(durations, filename):
         print(f"Valid Midea leader detected - Pulse: {leader_pulse}us, Space: {leader_space}us")
 
     # Decode data bits
-    bits = []
-    for i in range(2, len(durations) - 1, 2):
-        if i + 1 < len(durations):
-            pulse = durations[i]
-            space = durations[i + 1]
-            bit = decode_bit(pulse, space)
-            bits.append(bit)
-
-    bits_string = ''.join(bits)
-    print(f"\nDecoded bits ({len(bits)} total): {bits_string}")
+    bits_string = decode_bits(durations)
+    print(f"\nDecoded bits ({len(bits_string)} total): {bits_string}")
 
     # Clean up the bits for analysis
     if '?' in bits_string:
@@ -150,30 +186,21 @@ def process_ir_file_auto(durations, filename):
     # Decode Midea command
     if len(analysis_bits) >= 24:  # Need at least some bits for analysis
         print("\n--- Midea AC Command Analysis ---")
-        decode_midea_command(analysis_bits)
-        
-        # Convert bits to bytes for export
-        bytes_data = []
-        for i in range(0, len(analysis_bits), 8):
-            byte_str = analysis_bits[i:i+8]
-            if len(byte_str) == 8:
-                byte_val = int(byte_str, 2)
-                bytes_data.append(byte_val)
+        # The decoder hands back the parsed bytes for the export step
+        bytes_data = decode_midea_command(analysis_bits)
         
         # Generate suggested command name automatically
         suggested_name = generate_command_name(bytes_data, filename)
         print(f"\nUsing command name: '{suggested_name}'")
         
         # Export automatically with suggested name
-        command_name = suggested_name.replace(' ', '_').replace('-', '_')
-        command_name = ''.join(c for c in command_name if c.isalnum() or c == '_')
+        command_name = clean_command_name(suggested_name)
         
         if command_name:
-            export_for_esp_idf(analysis_bits, bytes_data, command_name, durations)
+            export_for_esp_idf(analysis_bits, bytes_data, command_name, durations, header_file=header_file)
             
             # Create template files on first export
-            if not os.path.exists("midea_ir_blaster.h"):
-                create_esp_idf_template()
+            if ensure_esp_idf_template():
                 print("\n✓ Created ESP-IDF template files:")
                 print("  - midea_ir_blaster.h (header file)")
                 print("  - midea_ir_blaster.c (implementation)")